@@ -248,6 +248,19 @@ s3 = Sphere().apply_transform(T)
 print('transformMesh',s3.center_of_mass(), (35,67,87))
 assert np.allclose(s3.center_of_mass(), (35,67,87))
 
+from vedo import LinearTransform, NonLinearTransform
+LT = LinearTransform().rotate_x(30).scale([1,2,3], origin=False).translate([1,2,3])
+M = LT.matrix
+LTinv = LT.compute_inverse()
+print('invert', LTinv.inverse_flag)
+assert np.allclose(LTinv.matrix @ M, np.eye(4))
+assert np.allclose(LT.matrix, M)  # original left untouched
+assert LTinv.inverse_flag
+NLT = NonLinearTransform(
+    source_points=[[0,0,0], [1,0,0], [0,1,0]], target_points=[[0,0,0], [1,0.1,0], [0,1,0.2]]
+)
+assert NLT.compute_inverse().inverse_flag
+
 
 ######################################normalize
 s3 = sphere.clone().pos(10,20,30).scale([7,8,9]).normalize()
@@ -348,6 +361,62 @@ q = transformations.spher2cyl(*q)
 q = transformations.cyl2cart(*q)
 print("cart2spher spher2cyl cyl2cart", q)
 assert np.allclose(q, [5,2,3])
+qs = np.random.rand(3, 100)
+buf = np.empty_like(qs)
+q = transformations.cart2spher(*qs, out=buf)
+assert q is buf
+q = transformations.spher2cart(*q)
+print("cart2spher spher2cart on arrays", q.shape)
+assert np.allclose(q, qs)
+q = transformations.cart2spher(*qs.astype(np.float16))
+assert q.dtype == np.float16
+buf = qs.copy()
+transformations.cart2spher(*buf, out=buf)  # in place
+transformations.spher2cart(*buf, out=buf)
+print("cart2spher spher2cart in place", buf.shape)
+assert np.allclose(buf, qs)
+
+###################################### LinearTransform
+from vedo import LinearTransform
+Rz90 = [[0,-1,0], [1,0,0], [0,0,1]]
+LT = LinearTransform().translate([1,2,3]).rotate_z(90)
+print("LinearTransform", LT.position, LT.orientation)
+assert np.allclose(LT.position, [-2,1,3])
+assert np.allclose(LT.matrix3x3, Rz90)
+assert np.allclose(LT.orientation, [0,0,90])
+LT.scale(2)  # around the current position
+assert np.allclose(LT.position, [-2,1,3])
+assert np.allclose(LT.matrix3x3, np.array(Rz90) * 2)
+assert np.allclose(LT.matrix[3], [0,0,0,1])
+M = LT.matrix
+LT.invert()
+assert np.allclose(LT.matrix3x3, np.array(Rz90).T / 2)
+assert np.allclose(LT.position, [-0.5,-1,-1.5])
+assert np.allclose(LT.matrix @ M, np.eye(4))
+LT.set_position([5,5,5])
+assert np.allclose(LT.position, [5,5,5])
+LT.reset()
+assert LT.is_identity()
+assert np.allclose(LT.position, [0,0,0])
+
+LT = LinearTransform().rotate_x(90, around=[0,1,0])
+assert np.allclose(LT.move([0,1,1]), [0,0,0])
+assert np.allclose(LT.move(np.array([[0,1,1], [0,1,0]])), [[0,0,0], [0,1,0]])
+
+LT = LinearTransform().reorient([0,0,1], [1,0,0], xyplane=False)
+assert np.allclose(LT.matrix3x3, [[0,0,1], [0,1,0], [-1,0,0]])
+assert np.allclose(LT.move([0,0,1]), [1,0,0])
+
+LTa = LinearTransform().translate([1,0,0])
+LTb = LinearTransform()
+LTa.concatenate(LTb)
+LTb.translate([0,0,5])
+assert np.allclose(LTa.position, [1,0,5])
+LTb.rotate_z(90)
+assert np.allclose(LTa.position, [0,1,5])
+LTa.concatenate(LTa)  # refused with a warning
+assert np.allclose(LTa.position, [0,1,5])
+
 
 ######################################
 print("OK with test_actors")
@@ -1,9 +1,19 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import math
+import threading
+
 import numpy as np
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 
 import vedo.vtkclasses as vtk
 
+try:
+    import orjson
+    _has_orjson = True
+except ModuleNotFoundError:
+    _has_orjson = False
+
 __docformat__ = "google"
 
 __doc__ = """
@@ -27,13 +37,65 @@ __all__ = [
 
 ###################################################
 def _is_sequence(arg):
+    if isinstance(arg, (list, tuple, np.ndarray)):
+        return True
     if hasattr(arg, "strip"):
         return False
-    if hasattr(arg, "__getslice__"):
-        return True
-    if hasattr(arg, "__iter__"):
-        return True
-    return False
+    return hasattr(arg, "__iter__")
+
+
+def _mat4_to_np(m):
+    """Copy a vtkMatrix4x4 into a 4x4 numpy array in a single call."""
+    arr = np.empty(16)
+    m.DeepCopy(arr, m)
+    return arr.reshape(4, 4)
+
+
+def _np_to_mat4(M):
+    """Copy a 4x4 (or 3x3) array-like into a vtkMatrix4x4 in a single call."""
+    M = np.asarray(M, dtype=float)
+    if M.shape == (3, 3):
+        M4 = np.eye(4)
+        M4[:3, :3] = M
+        M = M4
+    m = vtk.vtkMatrix4x4()
+    m.DeepCopy(M.ravel())
+    return m
+
+
+def _write_json(dictionary, filename):
+    """Write a dictionary holding numpy arrays to a json file, use orjson if available."""
+    if _has_orjson:
+        opts = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        with open(filename, "wb") as outfile:
+            outfile.write(orjson.dumps(dictionary, option=opts))
+    else:
+        import json
+        dictionary = {
+            k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in dictionary.items()
+        }
+        with open(filename, "w") as outfile:
+            json.dump(dictionary, outfile, sort_keys=True, indent=2)
+
+
+def _pts_to_vtkpoints(pts):
+    """Convert a list of 2D or 3D points into a vtkPoints in a single call."""
+    arr = np.asarray(pts)
+    if arr.dtype not in (np.float32, np.float64):
+        arr = arr.astype(np.float64)
+    if arr.ndim == 2 and arr.shape[1] == 2:
+        arr = np.c_[arr, np.zeros(len(arr), dtype=arr.dtype)]
+    arr = np.ascontiguousarray(arr).reshape(-1, 3)
+    vpts = vtk.vtkPoints()
+    vpts.SetData(numpy_to_vtk(arr, deep=True))
+    return vpts
+
+
+def _vtkpoints_to_np(vpts):
+    """Copy the coordinates of a vtkPoints into a (N, 3) float32 numpy array."""
+    if not vpts:
+        return np.array([], dtype=np.float32)
+    return vtk_to_numpy(vpts.GetData()).reshape(-1, 3).astype(np.float32)
 
 
 ###################################################
@@ -85,12 +147,7 @@ class LinearTransform:
 
         elif _is_sequence(T):
             S = vtk.vtkTransform()
-            M = vtk.vtkMatrix4x4()
-            n = len(T)
-            for i in range(n):
-                for j in range(n):
-                    M.SetElement(i, j, T[i][j])
-            S.SetMatrix(M)
+            S.SetMatrix(_np_to_mat4(T))
             T = S
 
         elif isinstance(T, vtk.vtkLinearTransform):
@@ -134,15 +191,12 @@ class LinearTransform:
                                 matrix[i, j] = float(v)
                         i += 1
             T = vtk.vtkTransform()
-            m = vtk.vtkMatrix4x4()
-            for i in range(4):
-                for j in range(4):
-                    m.SetElement(i, j, matrix[i][j])
-            T.SetMatrix(m)
+            T.SetMatrix(_np_to_mat4(matrix))
 
         self.T = T
         self.T.PostMultiply()
         self.inverse_flag = False
+        self._cached_mtime = -1
 
     def __str__(self):
         module = self.__class__.__module__
@@ -186,6 +240,7 @@ class LinearTransform:
     def move(self, obj):
         """
         Apply transformation to object or single point.
+        A numpy array of shape (N, 3) is transformed as a set of points.
 
         Note:
             When applying a transformation to a mesh, the mesh is modified in place.
@@ -210,6 +265,10 @@ class LinearTransform:
             ```
         """
         if _is_sequence(obj):
+            if isinstance(obj, np.ndarray) and obj.ndim == 2 and obj.shape[1] == 3:
+                # a set of points, transform them all at once
+                M = self.matrix
+                return obj @ M[:3, :3].T + M[:3, 3]
             n = len(obj)
             if n == 2:
                 obj = [obj[0], obj[1], 0]
@@ -275,11 +334,7 @@ class LinearTransform:
 
     def is_identity(self):
         """Check if identity."""
-        m = self.T.GetMatrix()
-        M = [[m.GetElement(i, j) for j in range(4)] for i in range(4)]
-        if np.allclose(M - np.eye(4), 0):
-            return True
-        return False
+        return bool(self.T.GetMatrix().IsIdentity())
 
     def invert(self):
         """Invert transformation."""
@@ -331,21 +386,21 @@ class LinearTransform:
         """
         if _is_sequence(T):
             S = vtk.vtkTransform()
-            M = vtk.vtkMatrix4x4()
-            n = len(T)
-            for i in range(n):
-                for j in range(n):
-                    M.SetElement(i, j, T[i][j])
-            S.SetMatrix(M)
+            S.SetMatrix(_np_to_mat4(T))
             T = S
 
+        if isinstance(T, LinearTransform):
+            if T is self:
+                print("Warning: cannot concatenate a LinearTransform to itself")
+                return self
+            T = T.T
+
         if pre_multiply:
             self.T.PreMultiply()
-        try:
             self.T.Concatenate(T)
-        except:
-            self.T.Concatenate(T.T)
-        self.T.PostMultiply()
+            self.T.PostMultiply()
+        else:
+            self.T.Concatenate(T)
         return self
 
     def __mul__(self, A):
@@ -379,21 +434,15 @@ class LinearTransform:
 
         if origin is True:
             p = np.array(self.T.GetPosition())
-            if np.linalg.norm(p) > 0:
-                self.T.Translate(-p)
-                self.T.Scale(*s)
-                self.T.Translate(p)
-            else:
-                self.T.Scale(*s)
-
         elif _is_sequence(origin):
-            origin = np.asarray(origin)
-            self.T.Translate(-origin)
-            self.T.Scale(*s)
-            self.T.Translate(origin)
-
+            p = np.asarray(origin)
         else:
             self.T.Scale(*s)
+            return self
+
+        self.T.Translate(-p)
+        self.T.Scale(*s)
+        self.T.Translate(p)
         return self
 
     def rotate(self, angle, axis=(1, 0, 0), point=(0, 0, 0), rad=False):
@@ -416,35 +465,19 @@ class LinearTransform:
         if not angle:
             return self
         if rad:
-            anglerad = angle
-        else:
-            anglerad = np.deg2rad(angle)
+            angle = math.degrees(angle)
         axis = np.asarray(axis) / np.linalg.norm(axis)
-        a = np.cos(anglerad / 2)
-        b, c, d = -axis * np.sin(anglerad / 2)
-        aa, bb, cc, dd = a * a, b * b, c * c, d * d
-        bc, ad, ac, ab, bd, cd = b * c, a * d, a * c, a * b, b * d, c * d
-        R = np.array(
-            [
-                [aa + bb - cc - dd, 2 * (bc + ad), 2 * (bd - ac)],
-                [2 * (bc - ad), aa + cc - bb - dd, 2 * (cd + ab)],
-                [2 * (bd + ac), 2 * (cd - ab), aa + dd - bb - cc],
-            ]
-        )
-        rv = np.dot(R, self.T.GetPosition() - np.asarray(point)) + point
-
-        if rad:
-            angle *= 180.0 / np.pi
-        # this vtk method only rotates in the origin of the object:
+        point = np.asarray(point)
+        self.T.Translate(-point)
         self.T.RotateWXYZ(angle, axis[0], axis[1], axis[2])
-        self.T.Translate(rv - np.array(self.T.GetPosition()))
+        self.T.Translate(point)
         return self
 
     def _rotatexyz(self, axe, angle, rad, around):
         if not angle:
             return self
         if rad:
-            angle *= 180 / np.pi
+            angle = math.degrees(angle)
 
         rot = dict(x=self.T.RotateX, y=self.T.RotateY, z=self.T.RotateZ)
 
@@ -507,58 +540,66 @@ class LinearTransform:
     #     print()
     #     return self
 
+    def _update_cache(self):
+        """Drop the cached matrix, orientation and scale if the vtkTransform was modified."""
+        mtime = self.T.GetMTime()
+        if mtime != self._cached_mtime:
+            self._cached_matrix = None
+            self._cached_orientation = None
+            self._cached_scale = None
+            self._cached_mtime = mtime
+
+    def _get_matrix(self):
+        """Get the current 4x4 matrix, cached until the vtkTransform is modified."""
+        self._update_cache()
+        if self._cached_matrix is None:
+            self._cached_matrix = _mat4_to_np(self.T.GetMatrix())
+        return self._cached_matrix
+
     def get_scale(self):
         """Get current scale."""
-        return np.array(self.T.GetScale())
+        self._update_cache()
+        if self._cached_scale is None:
+            self._cached_scale = self.T.GetScale()
+        return np.array(self._cached_scale)
 
     @property
     def orientation(self):
         """Compute orientation."""
-        return np.array(self.T.GetOrientation())
+        self._update_cache()
+        if self._cached_orientation is None:
+            self._cached_orientation = self.T.GetOrientation()
+        return np.array(self._cached_orientation)
 
     @property
     def position(self):
         """Compute position."""
-        return np.array(self.T.GetPosition())
+        return self._get_matrix()[:3, 3].copy()
 
     @property
     def matrix(self):
         """Get the 4x4 trasformation matrix."""
-        m = self.T.GetMatrix()
-        M = [[m.GetElement(i, j) for j in range(4)] for i in range(4)]
-        return np.array(M)
+        return self._get_matrix().copy()
 
     @matrix.setter
     def matrix(self, M):
         """Set trasformation by assigning a 4x4 or 3x3 numpy matrix."""
-        m = vtk.vtkMatrix4x4()
-        n = len(M)
-        for i in range(n):
-            for j in range(n):
-                m.SetElement(i, j, M[i][j])
-        self.T.SetMatrix(m)
+        self.T.SetMatrix(_np_to_mat4(M))
 
     @property
     def matrix3x3(self):
         """Get the 3x3 trasformation matrix."""
-        m = self.T.GetMatrix()
-        M = [[m.GetElement(i, j) for j in range(3)] for i in range(3)]
-        return np.array(M)
+        return self._get_matrix()[:3, :3].copy()
 
     def write(self, filename="transform.mat"):
         """Save transformation to ASCII file."""
-        import json
-        m = self.T.GetMatrix()
-        M = [[m.GetElement(i, j) for j in range(4)] for i in range(4)]
-        arr = np.array(M)
         dictionary = {
             "name": self.name,
             "comment": self.comment,
-            "matrix": arr.astype(float).tolist(),
+            "matrix": self._get_matrix(),
             "n_concatenated_transforms": self.n_concatenated_transforms,
         }
-        with open(filename, "w") as outfile:
-            json.dump(dictionary, outfile, sort_keys=True, indent=2)
+        _write_json(dictionary, filename)
 
     def reorient(
         self, initaxis, newaxis, around=(0, 0, 0), rotation=0, rad=False, xyplane=True
@@ -594,10 +635,10 @@ class LinearTransform:
         self.T.Translate(-p)
         if rotation:
             if rad:
-                rotation = np.rad2deg(rotation)
+                rotation = math.degrees(rotation)
             self.T.RotateWXYZ(rotation, initaxis)
 
-        self.T.RotateWXYZ(np.rad2deg(angleth), crossvec)
+        self.T.RotateWXYZ(math.degrees(angleth), crossvec)
 
         if xyplane:
             self.T.RotateWXYZ(-self.orientation[0] * 1.4142, newaxis)
@@ -683,18 +724,8 @@ class NonLinearTransform:
             sigma = D["sigma"]
 
             T = vtk.vtkThinPlateSplineTransform()
-            vptss = vtk.vtkPoints()
-            for p in source:
-                if len(p) == 2:
-                    p = [p[0], p[1], 0.0]
-                vptss.InsertNextPoint(p)
-            T.SetSourceLandmarks(vptss)
-            vptst = vtk.vtkPoints()
-            for p in target:
-                if len(p) == 2:
-                    p = [p[0], p[1], 0.0]
-                vptst.InsertNextPoint(p)
-            T.SetTargetLandmarks(vptst)
+            T.SetSourceLandmarks(_pts_to_vtkpoints(source))
+            T.SetTargetLandmarks(_pts_to_vtkpoints(target))
             T.SetSigma(sigma)
             if mode == "2d":
                 T.SetBasisToR2LogR()
@@ -716,18 +747,8 @@ class NonLinearTransform:
                 print(T)
 
             T = vtk.vtkThinPlateSplineTransform()
-            vptss = vtk.vtkPoints()
-            for p in source:
-                if len(p) == 2:
-                    p = [p[0], p[1], 0.0]
-                vptss.InsertNextPoint(p)
-            T.SetSourceLandmarks(vptss)
-            vptst = vtk.vtkPoints()
-            for p in target:
-                if len(p) == 2:
-                    p = [p[0], p[1], 0.0]
-                vptst.InsertNextPoint(p)
-            T.SetTargetLandmarks(vptst)
+            T.SetSourceLandmarks(_pts_to_vtkpoints(source))
+            T.SetTargetLandmarks(_pts_to_vtkpoints(target))
             T.SetSigma(sigma)
             if mode == "2d":
                 T.SetBasisToR2LogR()
@@ -787,49 +808,26 @@ class NonLinearTransform:
     @property
     def source_points(self):
         """Get the source points."""
-        pts = self.T.GetSourceLandmarks()
-        vpts = []
-        if pts:
-            for i in range(pts.GetNumberOfPoints()):
-                vpts.append(pts.GetPoint(i))
-        return np.array(vpts, dtype=np.float32)
+        return _vtkpoints_to_np(self.T.GetSourceLandmarks())
 
     @property
     def target_points(self):
         """Get the target points."""
-        pts = self.T.GetTargetLandmarks()
-        vpts = []
-        for i in range(pts.GetNumberOfPoints()):
-            vpts.append(pts.GetPoint(i))
-        return np.array(vpts, dtype=np.float32)
+        return _vtkpoints_to_np(self.T.GetTargetLandmarks())
 
     @source_points.setter
     def source_points(self, pts):
         """Set source points."""
-        if _is_sequence(pts):
-            pass
-        else:
+        if not isinstance(pts, (list, tuple, np.ndarray)):
             pts = pts.vertices
-        vpts = vtk.vtkPoints()
-        for p in pts:
-            if len(p) == 2:
-                p = [p[0], p[1], 0.0]
-            vpts.InsertNextPoint(p)
-        self.T.SetSourceLandmarks(vpts)
+        self.T.SetSourceLandmarks(_pts_to_vtkpoints(pts))
 
     @target_points.setter
     def target_points(self, pts):
         """Set target points."""
-        if _is_sequence(pts):
-            pass
-        else:
+        if not isinstance(pts, (list, tuple, np.ndarray)):
             pts = pts.vertices
-        vpts = vtk.vtkPoints()
-        for p in pts:
-            if len(p) == 2:
-                p = [p[0], p[1], 0.0]
-            vpts.InsertNextPoint(p)
-        self.T.SetTargetLandmarks(vpts)
+        self.T.SetTargetLandmarks(_pts_to_vtkpoints(pts))
 
     @property
     def sigma(self) -> float:
@@ -870,18 +868,15 @@ class NonLinearTransform:
 
     def write(self, filename):
         """Save transformation to ASCII file."""
-        import json
-
         dictionary = {
             "name": self.name,
             "comment": self.comment,
             "mode": self.mode,
             "sigma": self.sigma,
-            "source_points": self.source_points.astype(float).tolist(),
-            "target_points": self.target_points.astype(float).tolist(),
+            "source_points": self.source_points,
+            "target_points": self.target_points,
         }
-        with open(filename, "w") as outfile:
-            json.dump(dictionary, outfile, sort_keys=True, indent=2)
+        _write_json(dictionary, filename)
 
     def invert(self):
         """Invert transformation."""
@@ -942,6 +937,7 @@ class NonLinearTransform:
     def move(self, obj):
         """
         Apply transformation to the argument object.
+        A numpy array of shape (N, 3) is transformed as a set of points.
 
         Note:
             When applying a transformation to a mesh, the mesh is modified in place.
@@ -969,74 +965,221 @@ class NonLinearTransform:
             ```
         """
         if _is_sequence(obj):
+            if isinstance(obj, np.ndarray) and obj.ndim == 2 and obj.shape[1] == 3:
+                # a set of points, transform them all at once
+                vpts = vtk.vtkPoints()
+                vpts.SetDataTypeToDouble()
+                self.T.TransformPoints(_pts_to_vtkpoints(obj), vpts)
+                return vtk_to_numpy(vpts.GetData())
             return self.transform_point(obj)
         obj.apply_transform(self)
         return obj
 
 
 ########################################################################
+def _coords_out(out, n, *args):
+    """
+    Allocate the `(n, ...)` output buffer of a coordinate conversion.
+    If `out` is given, the inputs which may overlap with it are copied,
+    so they are not overwritten while the results are being written.
+    Return the output buffer and the inputs.
+    """
+    if out is None:
+        args = [np.asarray(a) for a in args]
+        shape = (n,) + np.broadcast(*args).shape
+        out = np.empty(shape, dtype=np.result_type(*args, 1.0))
+    else:
+        args = [np.array(a) if np.may_share_memory(out, a) else a for a in args]
+    return out, args
+
+
+_scratch = threading.local()
+
+
+def _scratch_buffers(n, shape, dtype):
+    """
+    Return `n` temporary arrays for the coordinate conversions.
+    They are kept per thread and reused as long as shape and dtype do not change.
+    """
+    bufs = getattr(_scratch, "bufs", [])
+    if len(bufs) < n or bufs[0].shape != shape or bufs[0].dtype != dtype:
+        bufs = [np.empty(shape, dtype=dtype) for _ in range(n)]
+        _scratch.bufs = bufs
+    return bufs[:n]
+
+
+def _numba_args(out, *args):
+    """
+    Check if the inputs of a coordinate conversion can be passed to a numba kernel,
+    these need float32 or float64 arrays of the same shape and dtype,
+    and a contiguous output buffer of that same dtype.
+    Return the flattened inputs, or None.
+    """
+    a0 = args[0]
+    if not isinstance(a0, np.ndarray) or a0.ndim == 0:
+        return None
+    if a0.dtype not in (np.float32, np.float64):
+        return None
+    for a in args[1:]:
+        if not isinstance(a, np.ndarray) or a.shape != a0.shape or a.dtype != a0.dtype:
+            return None
+    if (
+        not isinstance(out, np.ndarray)
+        or out.dtype != a0.dtype
+        or out.shape != (3,) + a0.shape
+        or not out.flags.c_contiguous
+    ):
+        return None
+    return [a.ravel() for a in args]
+
+
+_spher2cart_kernel = None
+
+
+def _get_spher2cart_kernel():
+    """
+    Compile the numba kernel of `spher2cart()` on first use.
+    Return False if numba is not available, numpy is then used instead.
+    """
+    global _spher2cart_kernel
+    if _spher2cart_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _spher2cart_kernel = False
+            return False
+
+        @njit(parallel=True, fastmath=True, cache=True)
+        def _spher2cart_numba(rho, theta, phi, out):
+            for i in prange(rho.size):
+                rst = rho[i] * np.sin(theta[i])
+                out[0, i] = rst * np.cos(phi[i])
+                out[1, i] = rst * np.sin(phi[i])
+                out[2, i] = rho[i] * np.cos(theta[i])
+
+        _spher2cart_kernel = _spher2cart_numba
+    return _spher2cart_kernel
+
+
 # 2d ######
-def cart2pol(x, y):
-    """2D Cartesian to Polar coordinates conversion."""
-    theta = np.arctan2(y, x)
-    rho = np.hypot(x, y)
-    return np.array([rho, theta])
+def cart2pol(x, y, out=None):
+    """
+    2D Cartesian to Polar coordinates conversion.
+
+    Inputs can be scalars or broadcastable arrays.
+    If `out` is given, results are written into it (shape `(2, ...)`).
+    """
+    out, (x, y) = _coords_out(out, 2, x, y)
+    np.hypot(x, y, out=out[0, ...])
+    np.arctan2(y, x, out=out[1, ...])
+    return out
+
 
+def pol2cart(rho, theta, out=None):
+    """
+    2D Polar to Cartesian coordinates conversion.
 
-def pol2cart(rho, theta):
-    """2D Polar to Cartesian coordinates conversion."""
-    x = rho * np.cos(theta)
-    y = rho * np.sin(theta)
-    return np.array([x, y])
+    Inputs can be scalars or broadcastable arrays.
+    If `out` is given, results are written into it (shape `(2, ...)`).
+    """
+    out, (rho, theta) = _coords_out(out, 2, rho, theta)
+    np.multiply(rho, np.cos(theta), out=out[0, ...])
+    np.multiply(rho, np.sin(theta), out=out[1, ...])
+    return out
 
 
 ########################################################################
 # 3d ######
-def cart2spher(x, y, z):
-    """3D Cartesian to Spherical coordinate conversion."""
-    hxy = np.hypot(x, y)
-    rho = np.hypot(hxy, z)
-    theta = np.arctan2(hxy, z)
-    phi = np.arctan2(y, x)
-    return np.array([rho, theta, phi])
-
-
-def spher2cart(rho, theta, phi):
-    """3D Spherical to Cartesian coordinate conversion."""
-    st = np.sin(theta)
-    sp = np.sin(phi)
-    ct = np.cos(theta)
-    cp = np.cos(phi)
-    rst = rho * st
-    x = rst * cp
-    y = rst * sp
-    z = rho * ct
-    return np.array([x, y, z])
-
-
-def cart2cyl(x, y, z):
-    """3D Cartesian to Cylindrical coordinate conversion."""
-    rho = np.sqrt(x * x + y * y)
-    theta = np.arctan2(y, x)
-    return np.array([rho, theta, z])
-
-
-def cyl2cart(rho, theta, z):
-    """3D Cylindrical to Cartesian coordinate conversion."""
-    x = rho * np.cos(theta)
-    y = rho * np.sin(theta)
-    return np.array([x, y, z])
-
-
-def cyl2spher(rho, theta, z):
-    """3D Cylindrical to Spherical coordinate conversion."""
-    rhos = np.sqrt(rho * rho + z * z)
-    phi = np.arctan2(rho, z)
-    return np.array([rhos, phi, theta])
-
-
-def spher2cyl(rho, theta, phi):
-    """3D Spherical to Cylindrical coordinate conversion."""
-    rhoc = rho * np.sin(theta)
-    z = rho * np.cos(theta)
-    return np.array([rhoc, phi, z])
+def cart2spher(x, y, z, out=None):
+    """
+    3D Cartesian to Spherical coordinate conversion.
+
+    Inputs can be scalars or broadcastable arrays.
+    If `out` is given, results are written into it (shape `(3, ...)`).
+    """
+    out, (x, y, z) = _coords_out(out, 3, x, y, z)
+    (hxy,) = _scratch_buffers(1, out.shape[1:], out.dtype)
+    np.hypot(x, y, out=hxy)
+    np.hypot(hxy, z, out=out[0, ...])
+    np.arctan2(hxy, z, out=out[1, ...])
+    np.arctan2(y, x, out=out[2, ...])
+    return out
+
+
+def spher2cart(rho, theta, phi, out=None):
+    """
+    3D Spherical to Cartesian coordinate conversion.
+
+    Inputs can be scalars or broadcastable arrays.
+    If `out` is given, results are written into it (shape `(3, ...)`).
+    """
+    out, (rho, theta, phi) = _coords_out(out, 3, rho, theta, phi)
+    args = _numba_args(out, rho, theta, phi)
+    if args:
+        kernel = _get_spher2cart_kernel()
+        if kernel:
+            kernel(*args, out.reshape(3, -1))
+            return out
+
+    rst, tmp = _scratch_buffers(2, out.shape[1:], out.dtype)
+    np.multiply(rho, np.sin(theta, out=tmp), out=rst)
+    np.multiply(rst, np.cos(phi, out=tmp), out=out[0, ...])
+    np.multiply(rst, np.sin(phi, out=tmp), out=out[1, ...])
+    np.multiply(rho, np.cos(theta, out=tmp), out=out[2, ...])
+    return out
+
+
+def cart2cyl(x, y, z, out=None):
+    """
+    3D Cartesian to Cylindrical coordinate conversion.
+
+    Inputs can be scalars or broadcastable arrays.
+    If `out` is given, results are written into it (shape `(3, ...)`).
+    """
+    out, (x, y, z) = _coords_out(out, 3, x, y, z)
+    np.hypot(x, y, out=out[0, ...])
+    np.arctan2(y, x, out=out[1, ...])
+    out[2, ...] = z
+    return out
+
+
+def cyl2cart(rho, theta, z, out=None):
+    """
+    3D Cylindrical to Cartesian coordinate conversion.
+
+    Inputs can be scalars or broadcastable arrays.
+    If `out` is given, results are written into it (shape `(3, ...)`).
+    """
+    out, (rho, theta, z) = _coords_out(out, 3, rho, theta, z)
+    np.multiply(rho, np.cos(theta), out=out[0, ...])
+    np.multiply(rho, np.sin(theta), out=out[1, ...])
+    out[2, ...] = z
+    return out
+
+
+def cyl2spher(rho, theta, z, out=None):
+    """
+    3D Cylindrical to Spherical coordinate conversion.
+
+    Inputs can be scalars or broadcastable arrays.
+    If `out` is given, results are written into it (shape `(3, ...)`).
+    """
+    out, (rho, theta, z) = _coords_out(out, 3, rho, theta, z)
+    np.hypot(rho, z, out=out[0, ...])
+    np.arctan2(rho, z, out=out[1, ...])
+    out[2, ...] = theta
+    return out
+
+
+def spher2cyl(rho, theta, phi, out=None):
+    """
+    3D Spherical to Cylindrical coordinate conversion.
+
+    Inputs can be scalars or broadcastable arrays.
+    If `out` is given, results are written into it (shape `(3, ...)`).
+    """
+    out, (rho, theta, phi) = _coords_out(out, 3, rho, theta, phi)
+    np.multiply(rho, np.sin(theta), out=out[0, ...])
+    out[1, ...] = phi
+    np.multiply(rho, np.cos(theta), out=out[2, ...])
+    return out